@@ -25,6 +25,7 @@ document.addEventListener('DOMContentLoaded', () => {
     const fullscreenChatLog = document.getElementById('fullscreenChatLog');
     const toggleFullscreenChat = document.getElementById('toggleFullscreenChat');
     const closeFullscreenChat = document.getElementById('closeFullscreenChat');
+    const chatAnnouncer = document.getElementById('chatAnnouncer');
 
     // --- State Management ---
     let currentProblem = '';
@@ -33,6 +34,17 @@ document.addEventListener('DOMContentLoaded', () => {
     let conversationMode = false; // Track if we're in conversation mode
     let currentMessageType = 'general'; // Track current message type
 
+    // --- Chat Rendering ---
+    const MAX_RENDERED_MESSAGES = 120; // Messages kept in the DOM per log before older ones are detached
+    const RENDER_CHUNK_SIZE = 40; // Messages restored at once when scrolling back through a long log
+    const MAX_FORMAT_CACHE_SIZE = 300; // Formatted HTML strings kept for reuse
+    const formattedHtmlCache = new Map(); // Raw text -> formatted HTML
+    let messageEntries = []; // Every displayed message, in order: { node, mirror }
+
+    // Each log renders the tail of messageEntries starting at firstRendered
+    const mainLog = { container: chatBox, key: 'node', firstRendered: 0, showEarlierBtn: null };
+    const fullscreenLog = { container: fullscreenChatLog, key: 'mirror', firstRendered: 0, showEarlierBtn: null };
+
     // --- Timer Management ---
     let timerInterval = null;
     let timeLeft = 25 * 60; // 25 minutes in seconds
@@ -44,6 +56,12 @@ document.addEventListener('DOMContentLoaded', () => {
     let animationId = null;
     let particles = [];
     let ctx = null;
+    let lastFrameTime = 0;
+    let particleColor = '';
+    const PARTICLE_FPS = 30; // Background decoration does not need the display's full refresh rate
+    const PARTICLE_FRAME_INTERVAL = 1000 / PARTICLE_FPS;
+    const BASE_FRAME_INTERVAL = 1000 / 60; // Particle speeds are expressed per 60fps frame
+    const spriteCache = new Map(); // `${symbol}|${size}` -> pre-rendered glyph canvas
 
     // Code symbols for particles
     const codeSymbols = ['{}', '[]', '()', '<>', '//', '/*', '*/', '=>', '&&', '||', '++', '--', '==', '!=', '+=', '-=', '*=', '/=', '%=', '<<', '>>', '&', '|', '^', '~', '!', '?', ':', ';', '=', '+', '-', '*', '/', '%', '.', ',', '_', '$', '#', '@'];
@@ -57,7 +75,7 @@ document.addEventListener('DOMContentLoaded', () => {
             this.x = Math.random() * window.innerWidth;
             this.y = Math.random() * window.innerHeight;
             this.symbol = codeSymbols[Math.floor(Math.random() * codeSymbols.length)];
-            this.size = Math.random() * 20 + 10;
+            this.size = Math.round(Math.random() * 20 + 10); // Whole pixels keep the sprite cache small
             this.speedX = (Math.random() - 0.5) * 0.5;
             this.speedY = (Math.random() - 0.5) * 0.5;
             this.opacity = Math.random() * 0.5 + 0.1;
@@ -65,10 +83,10 @@ document.addEventListener('DOMContentLoaded', () => {
             this.rotationSpeed = (Math.random() - 0.5) * 2;
         }
 
-        update() {
-            this.x += this.speedX;
-            this.y += this.speedY;
-            this.rotation += this.rotationSpeed;
+        update(step = 1) {
+            this.x += this.speedX * step;
+            this.y += this.speedY * step;
+            this.rotation += this.rotationSpeed * step;
 
             // Wrap around screen edges
             if (this.x < -50) this.x = window.innerWidth + 50;
@@ -80,16 +98,63 @@ document.addEventListener('DOMContentLoaded', () => {
         draw() {
             if (!ctx) return;
 
-            ctx.save();
-            ctx.translate(this.x, this.y);
-            ctx.rotate(this.rotation * Math.PI / 180);
+            // Blit the pre-rendered glyph instead of laying out text every frame
+            const sprite = getSymbolSprite(this.symbol, this.size);
+            const angle = this.rotation * Math.PI / 180;
+            const cos = Math.cos(angle);
+            const sin = Math.sin(angle);
+            ctx.setTransform(cos, sin, -sin, cos, this.x, this.y);
             ctx.globalAlpha = this.opacity;
-            ctx.font = `${this.size}px 'Courier New', monospace`;
-            ctx.fillStyle = getComputedStyle(document.documentElement).getPropertyValue('--fg');
-            ctx.textAlign = 'center';
-            ctx.textBaseline = 'middle';
-            ctx.fillText(this.symbol, 0, 0);
-            ctx.restore();
+            ctx.drawImage(sprite, -sprite.width / 2, -sprite.height / 2);
+        }
+    }
+
+    /**
+     * Create a canvas for drawing off-screen, preferring OffscreenCanvas where the browser supports it.
+     */
+    function createSpriteCanvas(width, height) {
+        if (typeof OffscreenCanvas !== 'undefined') {
+            return new OffscreenCanvas(width, height);
+        }
+        const canvas = document.createElement('canvas');
+        canvas.width = width;
+        canvas.height = height;
+        return canvas;
+    }
+
+    /**
+     * Return a cached bitmap of a code symbol at the given size in the current particle color.
+     */
+    function getSymbolSprite(symbol, size) {
+        const cacheKey = `${symbol}|${size}`;
+        let sprite = spriteCache.get(cacheKey);
+        if (sprite) return sprite;
+
+        // Monospace glyphs are ~0.6em wide; pad generously so wide symbols never clip
+        const width = Math.ceil(size * symbol.length * 0.7) + 4;
+        const height = Math.ceil(size * 1.4);
+        sprite = createSpriteCanvas(width, height);
+
+        const spriteCtx = sprite.getContext('2d');
+        spriteCtx.font = `${size}px 'Courier New', monospace`;
+        spriteCtx.fillStyle = particleColor;
+        spriteCtx.textAlign = 'center';
+        spriteCtx.textBaseline = 'middle';
+        spriteCtx.fillText(symbol, width / 2, height / 2);
+
+        spriteCache.set(cacheKey, sprite);
+        return sprite;
+    }
+
+    /**
+     * Pick up theme changes; sprites are drawn in the old color, so drop them when it changes.
+     * Called when the theme changes rather than per frame, since reading computed style is not free.
+     */
+    function refreshParticleColor() {
+        const color = getComputedStyle(document.documentElement).getPropertyValue('--fg').trim();
+        if (color !== particleColor) {
+            particleColor = color;
+            spriteCache.clear();
         }
     }
 
@@ -230,6 +295,7 @@ document.addEventListener('DOMContentLoaded', () => {
             prefersDarkMatcher.addEventListener('change', (e) => {
                 if (localStorage.getItem('theme') === 'system') {
                     applyTheme(e.matches ? 'dark' : 'light');
+                    refreshParticleColor();
                 }
             });
         } else {
@@ -253,6 +319,8 @@ document.addEventListener('DOMContentLoaded', () => {
             document.documentElement.setAttribute('data-theme', selectedTheme);
             updateMetaTheme(selectedTheme);
         }
+
+        refreshParticleColor();
     }
 
     function updateMetaTheme(theme) {
@@ -287,46 +355,172 @@ document.addEventListener('DOMContentLoaded', () => {
             messageDiv.appendChild(typeDiv);
         }
 
-        // Process text for enhanced formatting
-        const processedText = enhanceMessageFormatting(text);
+        // Formatting is regex-heavy, so reuse the result for text we've already seen
         const textDiv = document.createElement('div');
-        textDiv.innerHTML = processedText;
+        textDiv.innerHTML = getFormattedHtml(text);
         messageDiv.appendChild(textDiv);
 
-        chatBox.appendChild(messageDiv);
-        chatBox.scrollTop = chatBox.scrollHeight;
+        messageEntries.push({ node: messageDiv, mirror: null });
+        syncLog(mainLog);
 
-        // Also add to fullscreen chat if it's open
-        if (fullscreenChatModal && fullscreenChatModal.style.display !== 'none') {
-            const fullscreenMessageDiv = messageDiv.cloneNode(true);
-            fullscreenChatLog.appendChild(fullscreenMessageDiv);
-            fullscreenChatLog.scrollTop = fullscreenChatLog.scrollHeight;
+        // The log itself isn't live (restored history would be read out), so announce here
+        if (chatAnnouncer) {
+            // innerText keeps the badge/body boundary and line breaks that textContent drops
+            const announcement = messageDiv.innerText;
+            // Clear first so a repeat of the previous message still counts as a change
+            chatAnnouncer.textContent = '';
+            setTimeout(() => {
+                chatAnnouncer.textContent = announcement;
+            }, 50);
         }
 
+        // Keep the fullscreen chat in step while it's open; otherwise it catches up when opened
+        if (isFullscreenOpen()) {
+            syncLog(fullscreenLog);
+        }
 
         return messageDiv;
     }
 
+    /**
+     * Remove a message from both chat logs, e.g. a loading placeholder once the reply arrives.
+     * @param {HTMLElement} messageDiv - The div returned by displayMessage.
+     */
+    function removeMessage(messageDiv) {
+        // Placeholders are almost always among the newest messages, so search from the end
+        for (let i = messageEntries.length - 1; i >= 0; i--) {
+            const entry = messageEntries[i];
+            if (entry.node !== messageDiv) continue;
+
+            messageEntries.splice(i, 1);
+            entry.node.remove();
+            if (entry.mirror) entry.mirror.remove();
+            [mainLog, fullscreenLog].forEach(log => {
+                if (i < log.firstRendered) log.firstRendered--;
+                if (log.container) updateShowEarlierButton(log);
+            });
+            return;
+        }
+    }
+
+    /**
+     * Return the formatted HTML for a message, reusing earlier results for repeated text.
+     */
+    function getFormattedHtml(text) {
+        let html = formattedHtmlCache.get(text);
+        if (html === undefined) {
+            html = enhanceMessageFormatting(text);
+            if (formattedHtmlCache.size >= MAX_FORMAT_CACHE_SIZE) {
+                // Maps iterate in insertion order, so the first key is the oldest entry
+                formattedHtmlCache.delete(formattedHtmlCache.keys().next().value);
+            }
+            formattedHtmlCache.set(text, html);
+        }
+        return html;
+    }
+
+    /**
+     * Get a message's node for the given log, cloning it the first time the fullscreen log needs it.
+     */
+    function getLogNode(log, entry) {
+        if (!entry[log.key]) {
+            entry[log.key] = entry.node.cloneNode(true);
+        }
+        return entry[log.key];
+    }
+
+    /**
+     * Append any messages the log hasn't rendered yet and scroll to the newest one.
+     * Only the last MAX_RENDERED_MESSAGES stay attached; older ones come back on scroll.
+     */
+    function syncLog(log) {
+        if (!log.container) return;
+
+        const windowStart = Math.max(0, messageEntries.length - MAX_RENDERED_MESSAGES);
+        for (let i = log.firstRendered; i < windowStart; i++) {
+            const node = messageEntries[i][log.key];
+            if (node) node.remove();
+        }
+        log.firstRendered = Math.max(log.firstRendered, windowStart);
+
+        const fragment = document.createDocumentFragment();
+        for (let i = log.firstRendered; i < messageEntries.length; i++) {
+            const node = getLogNode(log, messageEntries[i]);
+            if (!node.isConnected) fragment.appendChild(node);
+        }
+        log.container.appendChild(fragment);
+        updateShowEarlierButton(log);
+        log.container.scrollTop = log.container.scrollHeight;
+    }
+
+    /**
+     * Re-attach a chunk of older messages above the ones currently rendered.
+     * @param {boolean} moveFocus - Focus the oldest restored message, for keyboard and screen-reader users.
+     */
+    function restoreOlderMessages(log, moveFocus = false) {
+        if (log.firstRendered === 0) return;
+
+        const start = Math.max(0, log.firstRendered - RENDER_CHUNK_SIZE);
+        const fragment = document.createDocumentFragment();
+        for (let i = start; i < log.firstRendered; i++) {
+            fragment.appendChild(getLogNode(log, messageEntries[i]));
+        }
+        const firstRestored = fragment.firstChild;
+        log.firstRendered = start;
+
+        // Keep the message the user was reading in place as content is added above it
+        const previousHeight = log.container.scrollHeight;
+        const anchor = log.showEarlierBtn && log.showEarlierBtn.isConnected
+            ? log.showEarlierBtn.nextSibling
+            : log.container.firstChild;
+        log.container.insertBefore(fragment, anchor);
+        updateShowEarlierButton(log);
+        log.container.scrollTop += log.container.scrollHeight - previousHeight;
+
+        if (moveFocus && firstRestored) {
+            firstRestored.tabIndex = -1;
+            firstRestored.focus();
+        }
+    }
+
+    /**
+     * Show a "Show earlier messages" control at the top of a log while older messages are detached,
+     * so they stay reachable without scrolling (e.g. with a screen reader's virtual cursor).
+     */
+    function updateShowEarlierButton(log) {
+        if (log.firstRendered === 0) {
+            if (log.showEarlierBtn) log.showEarlierBtn.remove();
+            return;
+        }
+
+        if (!log.showEarlierBtn) {
+            log.showEarlierBtn = document.createElement('button');
+            log.showEarlierBtn.type = 'button';
+            log.showEarlierBtn.classList.add('show-earlier-btn');
+            log.showEarlierBtn.textContent = 'Show earlier messages';
+            log.showEarlierBtn.addEventListener('click', () => restoreOlderMessages(log, true));
+        }
+        if (log.container.firstChild !== log.showEarlierBtn) {
+            log.container.insertBefore(log.showEarlierBtn, log.container.firstChild);
+        }
+    }
+
+    function isFullscreenOpen() {
+        return fullscreenChatModal && fullscreenChatModal.style.display !== 'none';
+    }
+
     /**
      * Open fullscreen chat modal
      */
     function openFullscreenChat() {
         if (!fullscreenChatModal || !fullscreenChatLog) return;
 
-        // Copy all existing messages to fullscreen chat
-        fullscreenChatLog.innerHTML = '';
-        const messages = chatBox.querySelectorAll('.chat-message');
-        messages.forEach(message => {
-            const clonedMessage = message.cloneNode(true);
-            fullscreenChatLog.appendChild(clonedMessage);
-        });
-
         // Show modal
         fullscreenChatModal.style.display = 'flex';
         document.body.style.overflow = 'hidden'; // Prevent background scrolling
 
-        // Scroll to bottom
-        fullscreenChatLog.scrollTop = fullscreenChatLog.scrollHeight;
+        // Append only the messages that arrived since it was last open, then scroll to bottom
+        syncLog(fullscreenLog);
 
         // Add a subtle entrance animation
         const modalContent = fullscreenChatModal.querySelector('.fullscreen-modal-content');
@@ -483,7 +677,7 @@ document.addEventListener('DOMContentLoaded', () => {
             const data = await response.json();
 
             // Remove loading message
-            loadingMessage.remove();
+            removeMessage(loadingMessage);
 
             // Display the new hint
             let botResponse = data.hint;
@@ -497,7 +691,7 @@ document.addEventListener('DOMContentLoaded', () => {
             });
 
         } catch (error) {
-            loadingMessage.remove();
+            removeMessage(loadingMessage);
             console.error('Error fetching another hint:', error);
             displayMessage("Oops! I couldn't reach the server. Please ensure the backend is running.", 'bot');
         } finally {
@@ -608,7 +802,7 @@ document.addEventListener('DOMContentLoaded', () => {
             const data = await response.json();
 
             // Remove loading message
-            loadingMessage.remove();
+            removeMessage(loadingMessage);
 
             // Display the bot's response
             const botResponse = data.response;
@@ -626,7 +820,7 @@ document.addEventListener('DOMContentLoaded', () => {
             currentMessageType = 'general';
 
         } catch (error) {
-            loadingMessage.remove();
+            removeMessage(loadingMessage);
             console.error('Error sending conversation message:', error);
             displayMessage("Oops! I couldn't reach the server. Please ensure the backend is running.", 'bot');
         } finally {
@@ -684,7 +878,7 @@ document.addEventListener('DOMContentLoaded', () => {
             const data = await response.json();
 
             // 5. Remove the loading message
-            loadingMessage.remove();
+            removeMessage(loadingMessage);
 
             // 6. Display the bot's actual response
             let botResponse = data.hint;
@@ -713,7 +907,7 @@ document.addEventListener('DOMContentLoaded', () => {
 
         } catch (error) {
             // 8. Handle network errors (e.g., server not running, connection issues)
-            loadingMessage.remove(); // Remove loading message even on network error
+            removeMessage(loadingMessage); // Remove loading message even on network error
             console.error('Error fetching hint:', error);
             displayMessage("Oops! I couldn't reach the server. Please ensure the backend is running.", 'bot');
         } finally {
@@ -774,6 +968,14 @@ document.addEventListener('DOMContentLoaded', () => {
         });
     });
 
+    // Bring back older messages when scrolling to the top of a long chat
+    [mainLog, fullscreenLog].forEach(log => {
+        if (!log.container) return;
+        log.container.addEventListener('scroll', () => {
+            if (log.container.scrollTop <= 50) restoreOlderMessages(log);
+        }, { passive: true });
+    });
+
     // Fullscreen chat event listeners
     if (toggleFullscreenChat) {
         toggleFullscreenChat.addEventListener('click', openFullscreenChat);
@@ -825,6 +1027,18 @@ document.addEventListener('DOMContentLoaded', () => {
     // Particles dropdown event listener
     particlesToggle.addEventListener('change', toggleParticles);
 
+    // Stop drawing particles while the tab is hidden and pick up again when it's visible
+    document.addEventListener('visibilitychange', () => {
+        if (document.hidden) {
+            if (animationId) {
+                cancelAnimationFrame(animationId);
+                animationId = null;
+            }
+        } else if (particlesActive && !animationId) {
+            animateParticles();
+        }
+    });
+
     // Window resize handler for particles
     window.addEventListener('resize', () => {
         if (particlesActive) {
@@ -913,6 +1127,7 @@ document.addEventListener('DOMContentLoaded', () => {
 
         // Initialize context
         ctx = particlesCanvas.getContext('2d');
+        refreshParticleColor();
 
         // Create particles
         particles = [];
@@ -923,17 +1138,30 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
 
-    function animateParticles() {
-        if (!particlesActive || !ctx) return;
+    function animateParticles(timestamp = performance.now()) {
+        if (!particlesActive || !ctx || document.hidden) {
+            animationId = null;
+            return;
+        }
+
+        animationId = requestAnimationFrame(animateParticles);
+
+        // Throttle to PARTICLE_FPS; the small tolerance absorbs rAF timing jitter
+        const elapsed = timestamp - lastFrameTime;
+        if (elapsed < PARTICLE_FRAME_INTERVAL - 2) return;
+        lastFrameTime = timestamp;
+
+        // Scale movement by elapsed time, capped so particles don't jump after a pause
+        const step = Math.min(elapsed, PARTICLE_FRAME_INTERVAL * 2) / BASE_FRAME_INTERVAL;
 
+        ctx.setTransform(1, 0, 0, 1, 0, 0);
+        ctx.globalAlpha = 1;
         ctx.clearRect(0, 0, particlesCanvas.width, particlesCanvas.height);
 
         particles.forEach(particle => {
-            particle.update();
+            particle.update(step);
             particle.draw();
         });
-
-        animationId = requestAnimationFrame(animateParticles);
     }
 
     function toggleParticles() {